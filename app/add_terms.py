@@ -6,11 +6,8 @@ Initially, senotypes only contained codes, and terms were fetched for display in
 UI when the senotype was selected.
 
 """
-import os
-import configobj
 import argparse
 from tqdm import tqdm
-import pandas as pd
 
 from models.appconfig import AppConfig
 from models.senlib_mysql import SenLibMySql
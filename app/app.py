@@ -5,7 +5,9 @@ from pathlib import Path
 from flask import Flask, render_template
 import json
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
+# orjson-backed JSON provider for jsonify
+from lib.jsonprovider import ORJSONProvider
 
 # Future development
 # from models.ftutree import FTUTree
@@ -54,6 +56,9 @@ class SenotypeUI:
         self.app.config.from_pyfile(self.config)
         self.app.secret_key = self.app.config['KEY']
 
+        # Serialize JSON responses (e.g., valuesets) with orjson.
+        self.app.json = ORJSONProvider(self.app)
+
         # Build valueset cache.
         self.app.valueset_cache = build_valueset_cache()
 
@@ -122,7 +127,7 @@ class SenotypeUI:
 # ###################################################################################################
 
 # Obtain the path to the configuration file.
-cfg = AppConfig()
+cfg = get_app_config()
 app = SenotypeUI(cfg.file, Path(__file__).absolute().parent.parent.parent).app
 
 if __name__ == "__main__":
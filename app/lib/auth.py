@@ -1,15 +1,19 @@
-from flask import abort
+from functools import lru_cache
+
 from globus_sdk import ConfidentialAppAuthClient, AuthClient, AccessTokenAuthorizer, GroupsClient, GlobusAPIError
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
+@lru_cache(maxsize=4)
 def load_app_client(consortium: str) -> ConfidentialAppAuthClient:
 
     """
     Initiates a Globus app client, based on the consortium.
+    The client is cached per consortium so that its HTTP session (and keep-alive
+    connections to Globus) is reused across requests.
     :param consortium: identifies a Globus environment
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
 
     #if consortium == 'CONTEXT_HUBMAP':
         #globus_client = cfg.getfield(key='GLOBUS_HUBMAP_CLIENT')
@@ -0,0 +1,56 @@
+"""
+Flask JSON provider that uses orjson for serialization and parsing.
+
+Used by jsonify and request.get_json. As with Flask's default provider, keys are
+sorted, and dates, Markup and other types that orjson does not handle natively
+fall back to the default provider's conversions. Non-ASCII characters are
+written as UTF-8 instead of escape sequences.
+"""
+import typing as t
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# Sort keys as the default provider does; pass dates through to the default
+# conversion so that they keep Flask's HTTP date format.
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONProvider(DefaultJSONProvider):
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        """
+        Serializes data as a JSON string.
+        Calls with keyword arguments (e.g., from the Jinja tojson filter) are passed
+        to the default provider, because orjson does not support them.
+        :param obj: data to serialize
+        """
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        """
+        Deserializes JSON from a string or bytes.
+        :param s: text or UTF-8 bytes
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any) -> Response:
+        """
+        Serializes the arguments as JSON and returns a Response, writing the orjson bytes
+        directly. In debug mode, or if compact is False, the output is indented.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+
+        option = _ORJSON_OPTIONS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype
+        )
@@ -8,6 +8,7 @@ This class looks for a file named "app.cfg" in the instance directory.
 
 """
 from configparser import ConfigParser
+from functools import cached_property, lru_cache
 from flask import abort
 from pathlib import Path
 import logging
@@ -108,19 +109,31 @@ class AppConfig:
 
         return listfields
 
+    @cached_property
+    def fields(self) -> dict:
+        """
+        Returns the app.cfg values as a dictionary keyed by field name, with quotes trimmed
+        from string values. The dictionary is built once per AppConfig instance.
+        """
+        return {t[0]: t[1].replace("'", "") for t in self.parser}
+
     def getfield(self, key: str) -> str:
         """
         Reads from the app.cfg to return a single value.
         :param key: key in the app.cfg file.
         :return: string value, extracted from the tuple obtained from the app.cfg corresponding to the key.
         """
-        field = ''
-        for t in self.parser:
-            if key == t[0]:
-                # Trim quotes from string fields in Flask config files.
-                field = t[1].replace("'", "")
+        field = self.fields.get(key, '')
 
         if field == '':
             abort(400, f'Missing key {key} in application configuration file.')
 
         return field
+
+@lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """
+    Returns the AppConfig for the process. The app.cfg file does not change while
+    the application runs, so it is read and parsed only once.
+    """
+    return AppConfig()
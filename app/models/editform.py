@@ -2,13 +2,11 @@
 Form used to create and update Senotype JSONs.
 """
 
-from wtforms import (Form, SelectField, validators, ValidationError,
-                     TextAreaField, FieldList, StringField, FormField, HiddenField)
+from wtforms import (Form, validators, ValidationError,
+                     TextAreaField, FieldList, StringField, FormField)
 from wtforms.validators import Email
 
 # Helper classes
-from models.appconfig import AppConfig
-from models.senlib import SenLib
 from models.stringnumber import stringisintegerorfloat
 
 
@@ -166,19 +164,6 @@ class RegMarkerEntryForm(Form):
 
 class EditForm(Form):
 
-    # Set up the Senlib interface to obtain valueset information.
-
-    # SENOTYPE TREEVIEW
-
-    # The features of the Senotype treeview depend on whether the user is authorized
-    # to edit senotype JSONs. The authorization compares the user's email address
-    # from Globus (in a session variable) with the email stored with a Senotype JSON.
-    def __init__(self, *args, **kwargs):
-        super(EditForm, self).__init__(*args, **kwargs)
-        # Import session in the method to avoid issues outside request context
-        from flask import session
-        self.senlib = SenLib(cfg=AppConfig(), userid=session.get('userid', ''))
-
     # SET DEFAULTS FOR FIELDS
 
     # Senotype
@@ -50,17 +50,12 @@ class FTUTree:
 
         organs = {}
 
-        for _, row in df.iterrows():
-            organ_label = row['organ_label']
-            organ_iri = row['organ_iri']
+        # itertuples yields plain tuples instead of building a Series per row.
+        columns = ['organ_label', 'organ_iri', 'ftu_label', 'ftu_iri', 'ftu_part_label', 'ftu_part_iri']
+        for (organ_label, organ_iri, ftu_label, ftu_iri,
+             ftu_part_label, ftu_part_iri) in df[columns].itertuples(index=False, name=None):
             organ_val = self._iri_value(organ_iri)
-
-            ftu_label = row['ftu_label']
-            ftu_iri = row['ftu_iri']
             ftu_val = self._iri_value(ftu_iri)
-
-            ftu_part_label = row['ftu_part_label']
-            ftu_part_iri = row['ftu_part_iri']
             ftu_part_val = self._iri_value(ftu_part_iri)
 
             # Organ node
@@ -1,27 +1,58 @@
 """
 Class for working with the hs-ontology-api
 """
+from threading import Lock
+
+from cachetools import TTLCache
 from flask import make_response
 from models.requestretry import RequestRetry
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
+
+# The list of SenNet organs only changes with a release of the UBKG, so cache it
+# for an hour instead of calling the hs-ontology-api for every organ lookup.
+_organs_cache = TTLCache(maxsize=1, ttl=3600)
+_organs_lock = Lock()
 
 
 class OntologyAPI:
 
     def __init__(self):
-        cfg = AppConfig()
+        cfg = get_app_config()
         self.urlbase = f"{cfg.getfield(key='UBKG_BASE_URL')}"
+        self.api = RequestRetry()
 
-    def get_ontology_api_response(self, endpoint: str, target: str):
+    def get_ontology_api_json(self, endpoint: str):
         """
-        Returns the response of an endpoint of the hs-ontology-api.
+        Returns the JSON of an endpoint of the hs-ontology-api, without translating
+        error messages into Flask responses. Safe to call outside the application
+        context--e.g., from worker threads.
+        :param endpoint: portion of the endpoint to append to the urlbase.
+        """
+        url = f"{self.urlbase}/{endpoint}"
+        return self.api.getresponse(url=url, format='json')
+
+    def get_ontology_api_raw(self, endpoint: str, target: str):
+        """
+        Returns the undecoded JSON body of an endpoint of the hs-ontology-api, for
+        routes that pass the response through to the client unchanged.
         :param endpoint: portion of the endpoint to append to the urlbase.
         :param target: description of the endpoint's entity--e.g., genes
+        :return: the body as bytes, or a 404 response
         """
-        api = RequestRetry()
         url = f"{self.urlbase}/{endpoint}"
 
-        response = api.getresponse(url=url, format='json')
+        response = self.api.getrawresponse(url=url)
+        if response is None or response.status_code != 200:
+            return make_response(f'no {target} found', 404)
+        return response.content
+
+    def get_ontology_api_response(self, endpoint: str, target: str):
+        """
+        Returns the response of an endpoint of the hs-ontology-api.
+        :param endpoint: portion of the endpoint to append to the urlbase.
+        :param target: description of the endpoint's entity--e.g., genes
+        """
+        response = self.get_ontology_api_json(endpoint=endpoint)
 
         if type(response) is dict:
             if response.get('message') is not None:
@@ -32,3 +63,29 @@ class OntologyAPI:
                 return response
         else:
             return response
+
+    def get_sennet_organs(self):
+        """
+        Returns the SenNet organs from the hs-ontology-api as a dict with keys:
+        - list: the organ list
+        - by_uberon: organs keyed by UBERON code
+        - by_term_lower: list of (lowercase term, {'code', 'term'}) tuples, for substring searches
+        The indexes are cached; error responses are not.
+        """
+        with _organs_lock:
+            organs = _organs_cache.get('sennet')
+
+        if organs is None:
+            response = self.get_ontology_api_response(endpoint='organs?application_context=sennet', target='organs')
+            if not isinstance(response, list):
+                return response
+
+            organs = {'list': response,
+                      'by_uberon': {organ.get('organ_uberon'): organ for organ in response},
+                      'by_term_lower': [(organ.get('term').lower(),
+                                         {'code': organ.get('organ_uberon'), 'term': organ.get('term')})
+                                        for organ in response]}
+            with _organs_lock:
+                _organs_cache['sennet'] = organs
+
+        return organs
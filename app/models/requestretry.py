@@ -6,61 +6,113 @@ Class for generic API GET requests that uses an exponential retry loop.
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 import requests
-from flask import abort
+import os
+from threading import Lock
+import logging
+
+# Logging is configured by the application (app.py).
+logger = logging.getLogger(__name__)
+
+
+def _build_session() -> requests.Session:
+    """
+    Builds the HTTP session shared by all RequestRetry instances in a process.
+
+    Use the HTTPAdapter's retry strategy, as described here:
+    https://oxylabs.io/blog/python-requests-retry
+
+    Five retries max.
+    A backoff factor of 2, which results in exponential increases in delays before each attempt.
+    Retry for scenarios such as Service Unavailable or Too Many Requests that often are returned in case
+    of an overloaded server.
+
+    Sharing the session keeps its connection pool--and the keep-alive connections to the
+    external APIs--alive across requests.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=50)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+_session = None
+_session_pid = None
+_session_lock = Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns the HTTP session for the current process.
+
+    uWSGI forks its workers from the master after the app loads, and the app makes
+    requests while loading (e.g., for the valueset cache). A session built before the
+    fork would leave the same keep-alive sockets in the pool of every worker, so a new
+    session is built whenever the process id changes.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session_pid != pid:
+        with _session_lock:
+            if _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
 
 
 class RequestRetry:
 
-    def __init__(self):
-        self.responsejson = ''
-        self.url = ''
-        self.error = None
+    # RequestRetry keeps no per-call state: each call returns its own response, so a single
+    # instance can be shared across requests and threads.
 
-    def getresponse(self, url: str, format: str = None, headers: dict = None) -> dict:
+    def getresponse(self, url: str, format: str = None, headers: dict = None) -> dict | list | str | None:
         """
         Obtains a response from a REST API.
         Employs a retry loop in case of timeout or other failures.
 
         :param url: the URL to the REST API
-        :param format: the format of the response--either 'json' or 'csv'
+        :param format: the format of the response--'json' or 'csv'
         :param headers: optional headers
-        :return: the response JSON
+        :return: the decoded JSON for 'json', otherwise the response text; None if the retries
+                 were exhausted
         """
 
-        self.url = url
-
-        # Use the HTTPAdapter's retry strategy, as described here:
-        # https://oxylabs.io/blog/python-requests-retry
-
-        # Five retries max.
-        # A backoff factor of 2, which results in exponential increases in delays before each attempt.
-        # Retry for scenarios such as Service Unavailable or Too Many Requests that often are returned in case
-        # of an overloaded server.
         try:
-            retry = Retry(
-                total=5,
-                backoff_factor=2,
-                status_forcelist=[429, 500, 502, 503, 504]
-            )
-
-            adapter = HTTPAdapter(max_retries=retry)
-
-            session = requests.Session()
-            session.mount('https://', adapter)
-            r = session.get(url=url, timeout=180, headers=headers)
+            r = _get_session().get(url=url, timeout=180, headers=headers)
 
             if format == 'json':
-                self.responsejson = r.json()
-                self.error = None
-                return self.responsejson
+                return r.json()
             else:
                 return r.text
 
         except requests.exceptions.ConnectionError as e:
-            self.error = e
             raise e
         except requests.exceptions.RetryError as e:
             print(f"RetryError: Max retries exceeded. Details: {e}")
-        except Exception as e:
-            self.error = e
+        except Exception:
             r.raise_for_status()
+
+    def getrawresponse(self, url: str, headers: dict = None) -> requests.Response | None:
+        """
+        Obtains a response from a REST API without decoding its body, for callers that
+        pass the body through unchanged.
+        Employs the same retry loop as getresponse.
+
+        :param url: the URL to the REST API
+        :param headers: optional headers
+        :return: the response, or None if the retries were exhausted
+        """
+
+        try:
+            return _get_session().get(url=url, timeout=180, headers=headers)
+
+        except requests.exceptions.RetryError as e:
+            logger.warning('RetryError: Max retries exceeded. Details: %s', e)
+            return None
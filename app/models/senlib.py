@@ -14,16 +14,19 @@ Functions in the class:
 
 """
 
-from flask import session, current_app, request, abort
+from flask import session, current_app
 from werkzeug.datastructures import MultiDict
 import requests
-from requests.exceptions import ConnectionError
+from requests.adapters import HTTPAdapter
 import logging
+from threading import Lock
+
+from cachetools import TTLCache
 import pandas as pd
 
 
 # Application configuration object
-from models.appconfig import AppConfig
+from models.appconfig import AppConfig, get_app_config
 
 # Interface to MySql database
 from models.senlib_mysql import SenLibMySql
@@ -37,6 +40,21 @@ logging.basicConfig(format='[%(asctime)s] %(levelname)s in %(module)s: %(message
                     level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S')
 logger = logging.getLogger(__name__)
 
+# SenLib instances, cached by user. Building a SenLib connects to the senlib database,
+# loads the valuesets and checks the status of external APIs, so reuse an instance
+# across the requests a user makes within a minute. The senotype treeview is rebuilt
+# when an instance is reused, because another worker may have written senotypes.
+_senlib_cache = TTLCache(maxsize=64, ttl=60)
+_senlib_lock = Lock()
+
+# HTTP session for calls to the SenNet uuid-api and search-api, shared so that
+# connections are kept alive across requests.
+_sennet_session = requests.Session()
+_sennet_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Prefixes of categorical fields in the Edit form that are required
+REQUIRED_FIELDLIST_PREFIXES = ('taxon-', 'location-', 'celltype-', 'hallmark-')
+
 
 class SenLib:
 
@@ -293,13 +311,14 @@ class SenLib:
         :param predicate: assertion predicate. Can be either an IRI or a term.
         """
 
-        df = self.assertionvaluesets
-
         # Check whether the predicate corresponds to an IRI.
-        dfassertion = df[df['predicate_IRI'] == predicate]
-        if len(dfassertion) == 0:
+        dfassertion = self.assertionvaluesets_by_iri.get(predicate)
+        if dfassertion is None:
             # Check whether the predicate corresponds to a term.
-            dfassertion = df[df['predicate_term'] == predicate]
+            dfassertion = self.assertionvaluesets_by_term.get(predicate)
+        if dfassertion is None:
+            # No match: return an empty valueset with the expected columns.
+            dfassertion = self.assertionvaluesets.iloc[0:0]
 
         return dfassertion
 
@@ -997,7 +1016,7 @@ class SenLib:
         """
 
         # Get the URL to the uuid-api.
-        cfg = AppConfig()
+        cfg = get_app_config()
         uuid_url = f"{cfg.getfield(key='UUID_BASE_URL')}"
 
         # request body
@@ -1007,7 +1026,7 @@ class SenLib:
         headers = {"Authorization": f"Bearer {token}"}
 
         # The uuid-api returns a list of dicts. The default call returns one element.
-        response = requests.post(url=uuid_url, headers=headers, json=data)
+        response = _sennet_session.post(url=uuid_url, headers=headers, json=data, timeout=10)
         responsejson = response.json()[0]
         sennet_id = responsejson.get('sennet_id', '')
         uuid = responsejson.get('uuid', '')
@@ -1034,9 +1053,8 @@ class SenLib:
         :param predicate_term: the predicate term
         """
 
-        df = self.assertionvaluesets
-        matched = df[df['predicate_term'] == predicate_term]['predicate_IRI']
-        iri = matched.iloc[0] if not matched.empty else None
+        dfassertion = self.assertionvaluesets_by_term.get(predicate_term)
+        iri = dfassertion['predicate_IRI'].iloc[0] if dfassertion is not None else None
         return iri
 
     def build_session_list(self, form_data: dict, field_name: str):
@@ -1407,9 +1425,8 @@ class SenLib:
         assertions = []
 
         df = self.context_assertion_code
-        for index, row in df.iterrows():
-            context_object_name = row['context_name']
-            code = row['code']
+        # itertuples yields plain tuples instead of building a Series per row.
+        for context_object_name, code in df[['context_name', 'code']].itertuples(index=False, name=None):
 
             objects = []
             # Look for a form data field with name that corresponds
@@ -1725,9 +1742,17 @@ class SenLib:
         # Call Search API to reindex this senotype
         token = session["groups_token"]
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.put(url=self.search_base_api+'reindex/'+senotypeid, headers=headers)
-        if not response.ok:
-            logger.error(f'Failed to reindex senotype with ID {senotypeid}')
+        # The senotype is already written, so a reindex that times out is logged like any other failure.
+        try:
+            response = _sennet_session.put(url=self.search_base_api+'reindex/'+senotypeid, headers=headers,
+                                           timeout=10)
+            if not response.ok:
+                logger.error(f'Failed to reindex senotype with ID {senotypeid}')
+        except requests.exceptions.Timeout:
+            logger.error(f'Failed to reindex senotype with ID {senotypeid}: the search-api timed out')
+
+        # The senotype data changed, so rebuild the treeview for this instance.
+        self.senotypetree = self._getsenotypejtree()
 
     def updatesuccessor(self, senotypeid: str, successorid: str):
         """
@@ -1756,6 +1781,15 @@ class SenLib:
 
 
 
+    def refresh(self):
+        """
+        Rebuilds the senotype treeview from the senlib database, for an instance that is
+        reused across requests. The valuesets and assertion maps do not change while the
+        application runs, and the API statuses are kept for the life of the instance.
+        """
+        self.senotypetree = self._getsenotypejtree()
+        self.submissionjson = {}
+
     def __init__(self, cfg: AppConfig, userid: str):
 
         """
@@ -1774,6 +1808,10 @@ class SenLib:
 
         # Senotype Editor assertion valuesets
         self.assertionvaluesets = self.database.assertionvaluesets
+        # Index the valuesets by predicate IRI and by predicate term so that lookups
+        # do not scan the DataFrame.
+        self.assertionvaluesets_by_iri = dict(tuple(self.assertionvaluesets.groupby('predicate_IRI', sort=False)))
+        self.assertionvaluesets_by_term = dict(tuple(self.assertionvaluesets.groupby('predicate_term', sort=False)))
 
         # Cache the assertion valuesets at the app level
         # for use by routes like valueset
@@ -1804,9 +1842,24 @@ class SenLib:
         logger.info(f'UBKG API status = {self.ubkgstatus}')
 
         # List of the prefixes of categorical fields in the Edit form that are required
-        self.required_fieldlist_prefixes = [
-            'taxon-',
-            'location-',
-            'celltype-',
-            'hallmark-'
-        ]
+        self.required_fieldlist_prefixes = REQUIRED_FIELDLIST_PREFIXES
+
+
+def get_senlib(userid: str) -> SenLib:
+    """
+    Returns a SenLib for the user, reusing an instance built within the last minute.
+    A reused instance has its senotype treeview refreshed from the database.
+    :param userid: user Globus id
+    """
+
+    with _senlib_lock:
+        senlib = _senlib_cache.get(userid)
+
+    if senlib is None:
+        senlib = SenLib(cfg=get_app_config(), userid=userid)
+        with _senlib_lock:
+            _senlib_cache[userid] = senlib
+    else:
+        senlib.refresh()
+
+    return senlib
@@ -10,7 +10,7 @@ from flask import request, session, abort
 from models.requestretry import RequestRetry
 
 # Application configuration object
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 # Configure consistent logging. This is done at the beginning of each module instead of with a superclass of
 # logger to avoid the need to overload function calls to logger.
@@ -23,7 +23,7 @@ class SenLibAPI:
     def __init__(self):
 
         self.api = RequestRetry()
-        self.cfg = AppConfig()
+        self.cfg = get_app_config()
 
     def getubkgstatus(self) -> str:
 
@@ -10,6 +10,8 @@ from flask import abort
 
 import pandas as pd
 import json
+# C-accelerated parser for the nested senotype JSON stored in the database.
+import orjson
 from typing import List, Tuple, Any
 
 from models.appconfig import AppConfig
@@ -49,7 +51,7 @@ class SenLibMySql:
         rows = self._fetch(query='SELECT * FROM senotype')
         for row in rows:
             senotypeid = row[0]
-            senotypejson = json.loads(row[1])  # Converts JSON string to dict
+            senotypejson = orjson.loads(row[1])  # Converts JSON string to dict
             senotype = senotypejson.get('senotype')
             provenance = senotype.get('provenance')
             successor = provenance.get('successor')
@@ -72,7 +74,7 @@ class SenLibMySql:
 
         rows = self._fetch(query='SELECT * FROM senotype')
         for row in rows:
-            senotypejson = json.loads(row[1])
+            senotypejson = orjson.loads(row[1])
             listjson.append(senotypejson)
 
         return listjson
@@ -100,7 +102,7 @@ class SenLibMySql:
         logger.info(f'Fetching senotype for {id}')
         rows = self._fetch(query=f'SELECT * FROM senotype where senotypeid="{id}"')
         for row in rows:
-            return json.loads(row[1])
+            return orjson.loads(row[1])
 
         return {}
 
@@ -147,12 +149,16 @@ class SenLibMySql:
 
         self.error = ''
         # Connect to the database.
+        # With autocommit, each query runs in its own transaction. Otherwise the first SELECT
+        # opens a REPEATABLE READ snapshot, and a connection that is reused across requests
+        # (see get_senlib) would keep reading senotypes as they were at that point.
         try:
             self.conn = mysql.connector.connect(
                 user=self.db_user,
                 password=self.db_pwd,
                 host=self.db_host,
-                database=self.db_name
+                database=self.db_name,
+                autocommit=True
             )
 
             logger.info(f'Connected to {self.db_name} as {self.db_user}')
@@ -7,7 +7,7 @@ proteins
 
 from flask import Blueprint, redirect, abort
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 bio_blueprint = Blueprint('bio', __name__, url_prefix='/bio')
 
@@ -61,7 +61,7 @@ def getbiodetail(sab: str, id: str = ''):
                 ontology (e.g., HGNC, UNIPROTKB)
     :param id: id
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     idsubmit = id
 
     if sab.upper() == 'OBO':
@@ -87,7 +87,7 @@ def getbiodetail(sab: str, id: str = ''):
 # Load the home page for the relevant ontology.
 @bio_blueprint.route('/home/<id>', methods=['GET'])
 def getbiohome(id: str):
-    cfg = AppConfig()
+    cfg = get_app_config()
 
     if id.upper() == 'CL':
         url = cfg.getfield(key='CL_HOME_URL')
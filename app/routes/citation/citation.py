@@ -5,7 +5,7 @@ information on citations.
 
 from flask import Blueprint, jsonify, redirect
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 from models.requestretry import RequestRetry
 
 citation_blueprint = Blueprint('citation', __name__, url_prefix='/citation')
@@ -23,7 +23,7 @@ def getcitationsearchterm(searchterm):
        where x is an integer.
     2. A string that is assumed to be part of a title of a citation.
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='EUTILS_SEARCH_BASE_URL')
     # The NCBI API Key allows for more than 3 searches/second. Without the API Key,
     # calls to EUtils will be erratic because of 429 errors.
@@ -48,7 +48,7 @@ def getcitationsearchid(ids):
     Search NCBI EUtils for information on the set of publications identified in the list of ids.
     :param ids: comma-delimited set of PMIDs.
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='EUTILS_SUMMARY_BASE_URL')
 
     # The NCBI API Key allows for more than 3 searches/second. Without the API Key,
@@ -79,7 +79,7 @@ def getcitationdetail(id: str = ''):
     Redirects to the PubMed detail page for the specified PMID.
     :param id: PMID
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='PUBMED_BASE_URL')
     url = f"{base_url}{id}"
     return redirect(url)
@@ -5,7 +5,7 @@ and pass a request body that includes the Globus authentication token.
 """
 from flask import redirect, session, Blueprint, url_for, jsonify
 import requests
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 
 dataset_blueprint = Blueprint('dataset', __name__, url_prefix='/dataset')
@@ -29,7 +29,7 @@ def get_dataset_api(entity_id):
     headers = {"Authorization": f"Bearer {token}"}
 
     # Get the uuid for this SenNet ID.
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='ENTITY_BASE_URL')
     url_entity = f"{base_url}{entity_id}"
     resp = requests.get(url=url_entity, headers=headers)
@@ -61,7 +61,7 @@ def get_dataset_portal_id(entity_id):
         return "UUID not found", 404
 
     # Redirect the browser to the Data Portal dataset page
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='DATA_PORTAL_BASE_URL')
     url_portal = f"{base_url}/dataset?uuid={uuid}"
     return redirect(url_portal)
@@ -72,6 +72,6 @@ def get_dataset_portal_explore():
     """
     Redirect to the SenNet Data Portal page.
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     url = cfg.getfield(key='DATA_PORTAL_BASE_URL')
     return redirect(url)
\ No newline at end of file
@@ -5,7 +5,7 @@ Digital Object Identifiers (DOIs).
 
 from flask import Blueprint, jsonify, redirect
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 from models.requestretry import RequestRetry
 
 doi_blueprint = Blueprint('doi', __name__, url_prefix='/doi')
@@ -18,7 +18,7 @@ def doi_search(id):
     :param id: DOI ID
 
     """
-    cfg = AppConfig()
+    cfg = get_app_config()
     api_base_url = cfg.getfield(key='DATACITE_API_BASE_URL')
     # Limit the search to at least SenNet provided-ids.
     provider_id = cfg.getfield(key='DATACITE_SENOTYPE_PROVIDER_ID')
@@ -49,7 +49,7 @@ def getdoidetail_id_route(id):
 def getdoidetail(id: str = ''):
 
     # Return the detail page of a DOI in DataCite.
-    cfg = AppConfig()
+    cfg = get_app_config()
     base_url = cfg.getfield(key='DATACITE_HOME_URL')
     if id != '':
         # Add the DataCite provider ID for senotypes to the URL.
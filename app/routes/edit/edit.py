@@ -4,14 +4,13 @@ Edit route:
 2. Initiates a new Senotype, which will be written to the database via the Update route.
 
 """
-from flask import Blueprint, request, render_template, session, current_app, redirect, url_for, abort
+from flask import Blueprint, request, render_template, session, redirect, url_for, abort
 
 # The EditForm WTForm
 from models.editform import EditForm
 
 # Helper classes
-from models.appconfig import AppConfig
-from models.senlib import SenLib
+from models.senlib import get_senlib
 
 import logging
 
@@ -31,8 +30,7 @@ def edit():
 
 
     # Clear any prior error messages that can display in the edit form.
-    if 'flashes' in session:
-        session['flashes'].clear()
+    session.pop('_flashes', None)
 
     # If the user has not been authenticated by Globus, redirect
     # to the Globus login route.
@@ -45,24 +43,10 @@ def edit():
         abort(code=403,
               description='Your token has expired. Please log in again.')
 
-    # Read the app.cfg file outside the Flask application context.
-
-    cfg = AppConfig()
-
     # Get IDs for existing Senotype submissions.
 
     # Senlib interface that fetches senotype data and builds the Senotype treeeview.
-    senlib = SenLib(cfg=cfg, userid=session['userid'])
-
-    # Check if we have session data for the form.
-    # The presence of session data corresponds to the state of the form at the time of
-    # validation errors resulting from an attempt at updating.
-
-    # This form data represents the edited state of either a new submission or modifications to an
-    # existing submission.
-
-    form_data = session.pop('form_data', None)
-    form_errors = session.pop('form_errors', None)
+    senlib = get_senlib(userid=session['userid'])
 
     # Future development
     # Current state of the FTU paths input.
@@ -75,23 +59,7 @@ def edit():
 
     selected_node_id = request.form.get('selected_node_id') or request.args.get('selected_node_id')
 
-    if form_data:
-        # Populate the form with session data--i.e., the data for the submission that
-        # the user is attempting to add or update.
-
-        form = EditForm(data=form_data)
-        senlib.getsessiondata(form=form, form_data=form_data)
-
-        # Obtain information on the selected FTU path.
-
-        # Re-inject validation errors from the failed update.
-        if form_errors:
-            for field_name, errs in form_errors.items():
-                if hasattr(form, field_name):
-                    form_field = getattr(form, field_name)
-                    form_field.errors = errs
-
-    elif request.method == 'POST' or 'selected_node_id' in session:
+    if request.method == 'POST' or 'selected_node_id' in session:
 
         # This is the result of a POST triggered by the change event in the senotype
         # treeview.  Fetch submission data from the senlib database if the
@@ -127,8 +95,9 @@ def edit():
 
     elif request.method == 'GET':
 
-        # This scenario occurs on the initial load of the form as a result of a
-        # redirect--either from Globus login or from a failed update.
+        # This scenario occurs on the initial load of the form as a result of the
+        # redirect from Globus login. (A failed update renders the form from the
+        # update route instead.)
 
         # Load an empty form.
         form = EditForm()
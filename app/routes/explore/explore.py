@@ -9,14 +9,14 @@ regulating markers.
 
 from flask import Blueprint, redirect, abort
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 explore_blueprint = Blueprint('explore', __name__, url_prefix='/explore')
 
 # Return the specified home page.
 @explore_blueprint.route('/<id>', methods=['GET'])
 def getmarkerdetailidroute(id):
-    cfg = AppConfig()
+    cfg = get_app_config()
 
     if 'HGNC' in id.upper():
         base_url = cfg.getfield(key='HGNC_HOME_URL')
@@ -8,7 +8,7 @@ import json
 from flask import Blueprint, request, redirect, session, abort, render_template, make_response
 
 # Helper classes
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 from lib.auth import load_app_client, get_user_info, get_group_info
 
@@ -16,6 +16,14 @@ auth_blueprint = Blueprint('auth', __name__, url_prefix='/auth')
 login_blueprint = Blueprint('login', __name__, url_prefix='/login')
 logout_blueprint = Blueprint('logout', __name__, url_prefix='/logout')
 
+# Globus configuration
+cfg = get_app_config()
+# The Globus Auth session redirects to the login route.
+GLOBUS_URL = cfg.getfield(key='GLOBUS_URL')
+GLOBUS_SENNET_CLIENT = cfg.getfield(key='GLOBUS_SENNET_CLIENT')
+GLOBUS_EDIT_GROUP_UUID = cfg.getfield(key='GLOBUS_EDIT_GROUP_UUID')
+FLASK_APP_BASE_URI = cfg.getfield(key='FLASK_APP_BASE_URI')
+
 @auth_blueprint.route('', methods=['GET'])
 def auth():
     # Check if user is already logged in and token is still active. Redirect to edit page
@@ -72,8 +80,7 @@ def login():
     """
 
     # Clear messages.
-    if 'flashes' in session:
-        session['flashes'].clear()
+    session.pop('_flashes', None)
 
     # Obtain consortium and donorid.
     if 'state' in request.args:
@@ -85,10 +92,7 @@ def login():
     client = load_app_client(consortium)
 
     # The Globus Auth session will redirect to this route.
-    cfg = AppConfig()
-
-    redirect_uri = cfg.getfield(key='GLOBUS_URL')
-    client.oauth2_start_flow(redirect_uri, refresh_tokens=True)
+    client.oauth2_start_flow(GLOBUS_URL, refresh_tokens=True)
 
     # If there's no "code" argument in the request object, then this is the first execution of the route.
     # Redirect out to Globus Auth, identifying the consortium and donor id via the state key.
@@ -139,7 +143,6 @@ def login():
 
 @logout_blueprint.route('', methods=['GET'])
 def logout():
-    cfg = AppConfig()
 
     client = load_app_client(session['consortium'])
 
@@ -150,8 +153,8 @@ def logout():
 
     globus_logout_url = (
             "https://auth.globus.org/v2/web/logout"
-            + "?client={}".format(cfg.getfield("GLOBUS_SENNET_CLIENT"))
-            + "&redirect_uri={}".format(cfg.getfield("FLASK_APP_BASE_URI"))
+            + "?client={}".format(GLOBUS_SENNET_CLIENT)
+            + "&redirect_uri={}".format(FLASK_APP_BASE_URI)
             + "&redirect_name={}".format("Senotype Editor")
     )
 
@@ -163,13 +166,8 @@ def logout():
     return response
 
 def check_senotype_edit_member():
-    cfg = AppConfig()
-    is_senotype_edit_member = False
-    user_groups = get_group_info(session['groups_token'])
-    for group in user_groups:
-        if group['id'] == cfg.getfield(key='GLOBUS_EDIT_GROUP_UUID'):
-            is_senotype_edit_member = True
-            break
+    user_groups = get_group_info(session['groups_token']) or []
+    is_senotype_edit_member = GLOBUS_EDIT_GROUP_UUID in {group['id'] for group in user_groups}
 
     if not is_senotype_edit_member:
         abort(code=403,
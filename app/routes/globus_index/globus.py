@@ -4,7 +4,12 @@ Index route that authenticates to Globus to allow calls to SenNet APIs:
 - uuid-api
 """
 
-from flask import Blueprint, request, redirect, session
+from flask import Blueprint, redirect, session
+
+import logging
+
+# Logging is configured by the application (app.py).
+logger = logging.getLogger(__name__)
 
 globus_blueprint = Blueprint('globus', __name__, url_prefix='/')
 
@@ -13,12 +18,11 @@ globus_blueprint = Blueprint('globus', __name__, url_prefix='/')
 def globus():
 
     # Clear messages.
-    if 'flashes' in session:
-        session['flashes'].clear()
+    session.pop('_flashes', None)
 
     # Pass the Globus environment to which to authenticate.
     session['consortium'] = 'CONTEXT_SENNET'
     # Authenticate to Globus via the login route.
     # If login is successful, Globus will redirect to the edit page.
-    print('Logging into Globus...')
+    logger.debug('Logging into Globus...')
     return redirect(f'/auth')
@@ -1,7 +1,13 @@
-from flask import Blueprint
+from flask import Blueprint, Response
 
 health_blueprint = Blueprint('health', __name__)
 
+# The health response never changes, so build its parts once.
+# A new Response is still returned for each request because Flask's
+# after-request processing can modify the headers of the response object.
+_HEALTH_BODY = b'OK'
+_HEALTH_HEADERS = {'Cache-Control': 'no-cache'}
+
 
 @health_blueprint.route('/health', methods=['GET'])
 def get_health():
@@ -9,4 +15,4 @@ def get_health():
     Used for health checks of the Senotype Editor application.
 
     """
-    return "OK", 200
+    return Response(_HEALTH_BODY, status=200, headers=_HEALTH_HEADERS, mimetype='text/plain')
@@ -3,43 +3,108 @@ Calls the hs-ontology API.
 
 """
 import re
-from flask import Blueprint, make_response
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from cachetools import TTLCache
+from flask import Blueprint, Response, jsonify, make_response, request
 from models.ontology_class import OntologyAPI
 
 ontology_blueprint = Blueprint('ontology', __name__, url_prefix='/ontology')
 ontapi = OntologyAPI()
 
+# Vocabulary prefixes stripped from ids, in lowercase.
+_ID_PREFIXES = ('hgnc:', 'uniprotkb:', 'cl:')
+
+# Search strings shaped like DOID codes--e.g., "1234" or "DOID:1234".
+_DOID_RE = re.compile(r'^(?:DOID:)?\d+$', re.IGNORECASE)
+
+# Autocomplete lookups are functions of the search string alone. Cache successful
+# results briefly so that repeated keystrokes do not repeat calls to the hs-ontology-api.
+_lookup_cache = TTLCache(maxsize=2048, ttl=300)
+_lookup_lock = Lock()
+
+# Worker threads for the independent per-code calls in diagnosis searches.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ontology')
+
 def prepare_id(id:str) -> str:
     """
     Strips case-variant vocabulary prefix from id--e.g., "HGNC:1001" -> "1001"
 
     """
 
-    stripped = re.sub(r'(?i)hgnc:', '', id)
-    stripped = re.sub(r'(?i)uniprotkb:', '', stripped)
-    stripped = re.sub(r'(?i)cl:', '', stripped)
+    low = id.lower()
+    for prefix in _ID_PREFIXES:
+        if low.startswith(prefix):
+            return id[len(prefix):]
+    return id
+
+
+def cached_lookup(category: str, subpath: str, lookup):
+    """
+    Returns the result of a lookup, from the cache if possible.
+    Only list and bytes results are cached; error responses are not.
+    :param category: type of lookup--e.g., genes
+    :param subpath: search string. Case variants share a cache entry.
+    :param lookup: function that performs the lookup for subpath
+    """
+
+    key = (category, subpath.lower())
+    with _lookup_lock:
+        result = _lookup_cache.get(key)
+
+    if result is None:
+        result = lookup(subpath)
+        if isinstance(result, (list, bytes)):
+            with _lookup_lock:
+                _lookup_cache[key] = result
+
+    return result
+
+
+def cacheable_response(result):
+    """
+    Builds a response for ontology data that browsers and proxies may cache for
+    five minutes. The ETag lets repeated requests be answered with 304 Not Modified.
+    :param result: JSON bytes from upstream, which are passed through without decoding;
+                   a list to serialize; or an error response, which is returned as is.
+    """
+
+    if isinstance(result, bytes):
+        resp = Response(result, mimetype='application/json')
+    elif isinstance(result, list):
+        resp = jsonify(result)
+    else:
+        return result
+
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 300
+    resp.add_etag()
+    return resp.make_conditional(request)
 
-    return stripped
 
 @ontology_blueprint.route('/genes/<subpath>')
 def ontology_genes_proxy(subpath):
 
     endpoint = f'genes/{prepare_id(subpath)}'
-    return ontapi.get_ontology_api_response(endpoint=endpoint,target='genes')
+    return cacheable_response(cached_lookup('genes', endpoint,
+                                            lambda e: ontapi.get_ontology_api_raw(endpoint=e, target='genes')))
 
 
 @ontology_blueprint.route('/proteins/<subpath>')
 def ontology_proteins_proxy(subpath):
 
     endpoint = f'proteins/{prepare_id(subpath)}'
-    return ontapi.get_ontology_api_response(endpoint=endpoint, target='proteins')
+    return cacheable_response(cached_lookup('proteins', endpoint,
+                                            lambda e: ontapi.get_ontology_api_raw(endpoint=e, target='proteins')))
 
 
 @ontology_blueprint.route('/celltypes/<subpath>')
 def ontology_celltypes_proxy(subpath):
 
     endpoint = f'celltypes/{prepare_id(subpath.lower())}'
-    return ontapi.get_ontology_api_response(endpoint=endpoint, target='celltypes')
+    return cacheable_response(cached_lookup('celltypes', endpoint,
+                                            lambda e: ontapi.get_ontology_api_raw(endpoint=e, target='celltypes')))
 
 
 @ontology_blueprint.route('/diagnoses/<subpath>')
@@ -49,59 +114,78 @@ def ontology_diagnoses_proxy_generic(subpath):
     # Try to find a diagnosis by searching on code.
 
     subpath = prepare_id(subpath)
-    diag = ontology_diagnoses_proxy_term(subpath)
-    if len(diag) == 0:
-        diag = ontology_diagnoses_proxy_code(subpath)
-    return diag
+
+    # A search string that looks like a code cannot match a term, so skip the term search.
+    if _DOID_RE.match(subpath.strip()):
+        return ontology_diagnoses_proxy_code(subpath.strip())
+
+    diag = cached_lookup('diagnosis_term', subpath, _resolve_diagnosis_term)
+    if not isinstance(diag, list) or len(diag) == 0:
+        return ontology_diagnoses_proxy_code(subpath)
+    return cacheable_response(diag)
 
 
 @ontology_blueprint.route('/diagnoses/<subpath>/term')
 def ontology_diagnoses_proxy_term(subpath):
 
     # Returns information on a diagnosis based on a search string.
+    return cacheable_response(cached_lookup('diagnosis_term', subpath, _resolve_diagnosis_term))
+
+
+def _resolve_diagnosis_term(subpath: str):
+
+    # Returns the diagnoses for a search term: a list, which is empty if no code matches
+    # the term, or an error response if a call to the hs-ontology-api fails. Only complete
+    # results are lists, so cached_lookup does not cache failures.
 
     # First get the DOID code corresponding to the search term.
 
-    endpoint = f'terms/{subpath}/codes'
+    # Search on the lowercase term, so that case variants need only one call.
+    endpoint = f'terms/{subpath.lower()}/codes'
 
-    response = ontapi.get_ontology_api_response(endpoint=endpoint, target='diagnoses')
-    # The response is either a list of dicts or a dict with a message key.
+    response = ontapi.get_ontology_api_json(endpoint=endpoint)
+    # The response is either a list of dicts or, if no code matches, a dict with a message key.
 
-    # Try a case-sensitive search.
-    print('ontology_diagnoses_proxy_term, case-sensitive', response)
-    if type(response) is not list:
-        # Try a case-insensitive search.
-        endpoint = f'terms/{subpath.lower()}/codes'
-        response = ontapi.get_ontology_api_response(endpoint=endpoint, target='diagnoses')
+    if isinstance(response, dict) and response.get('message') is not None:
+        return []
+    if not isinstance(response, list):
+        return make_response('no diagnoses found', 404)
 
     diag_response = []
-    if type(response) is list:
-        for r in response:
-            sab = r.get('code').split(':')[0]
-            code = r.get('code')
-            if sab in ['DOID']:
-                # Get the PT for the diagnosis code.
-                endpoint2 = f"codes/{code}/terms"
-                # Because the prior call found a code, there will be
-                # a response that is a list of term dicts.
-                response2 = ontapi.get_ontology_api_response(endpoint=endpoint2, target='diagnoses')
-                terms = response2[0].get('terms')
-                for t in terms:
-                    if t.get('term_type') == 'PT':
-                        diag_response.append({'code': code, 'term': t.get('term')})
+    doid_codes = [r.get('code') for r in response if r.get('code').split(':')[0] == 'DOID']
+    # Get the PTs for the diagnosis codes in parallel.
+    for code, response2 in zip(doid_codes, _executor.map(_get_code_terms, doid_codes)):
+        # Because the prior call found a code, a response that is not a list of
+        # term dicts means that the call failed.
+        if not isinstance(response2, list):
+            return make_response('no diagnoses found', 404)
+        terms = response2[0].get('terms')
+        for t in terms:
+            if t.get('term_type') == 'PT':
+                diag_response.append({'code': code, 'term': t.get('term')})
     return diag_response
 
 
+def _get_code_terms(code: str):
+    # Returns the terms for a code. Runs in the worker threads, outside the application context.
+    return ontapi.get_ontology_api_json(endpoint=f'codes/{code}/terms')
+
+
 @ontology_blueprint.route('/diagnoses/<subpath>/code')
 def ontology_diagnoses_proxy_code(subpath):
     # Returns information on a diagnosis based on a code.
+    return cacheable_response(cached_lookup('diagnosis_code', subpath, _resolve_diagnosis_code))
 
-    if 'DOID' not in subpath.upper():
-        subpath = 'DOID:' + subpath.upper()
-    endpoint = f'codes/{subpath.upper()}/terms'
+
+def _resolve_diagnosis_code(subpath: str):
+
+    subpath = subpath.upper()
+    if 'DOID' not in subpath:
+        subpath = 'DOID:' + subpath
+    endpoint = f'codes/{subpath}/terms'
     response = ontapi.get_ontology_api_response(endpoint=endpoint, target='diagnoses')
 
-    if type(response) is not list:
+    if not isinstance(response, list):
         # Error (404, 400) from API
         return response
 
@@ -123,27 +207,26 @@ def ontology_diagnoses_proxy_code(subpath):
 def ontology_organs_proxy_term(subpath):
     # Returns information on a SenNet organ based on a search term.
 
-    endpoint = f'organs?application_context=sennet'
-
-    organs = ontapi.get_ontology_api_response(endpoint=endpoint, target='organs')
-    organ_response = []
-    for organ in organs:
-        if subpath.lower() in organ.get('term').lower():
-            organ_response.append({'code': organ.get('organ_uberon'),'term': organ.get('term')})
+    organs = ontapi.get_sennet_organs()
+    if not isinstance(organs, dict):
+        # Error (404) from API
+        return organs
 
-    return organ_response
+    searchterm = subpath.lower()
+    return cacheable_response([organ for term_lower, organ in organs['by_term_lower'] if searchterm in term_lower])
 
 
 @ontology_blueprint.route('/organs/<subpath>/code')
 def ontology_organs_proxy_code(subpath):
     # Returns information on a SenNet organ based on a code.
 
-    endpoint = f'organs?application_context=sennet'
+    organs = ontapi.get_sennet_organs()
+    if not isinstance(organs, dict):
+        # Error (404) from API
+        return organs
 
-    organs = ontapi.get_ontology_api_response(endpoint=endpoint, target='organs')
-    organ_response = []
-    for organ in organs:
-        if subpath == organ.get('organ_uberon'):
-            organ_response.append({'code': organ.get('organ_uberon'),'term': organ.get('term')})
+    organ = organs['by_uberon'].get(subpath)
+    if organ is None:
+        return cacheable_response([])
 
-    return organ_response
+    return cacheable_response([{'code': organ.get('organ_uberon'),'term': organ.get('term')}])
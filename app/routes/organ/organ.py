@@ -2,13 +2,18 @@
 The dataset routes allow the Edit page to call the SenNet Data Portal's organ page.
 
 """
-from flask import redirect, Blueprint
+from flask import redirect, Blueprint, abort
 
 from models.ontology_class import OntologyAPI
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 
 organ_blueprint = Blueprint('organs', __name__, url_prefix='/organs')
 
+# URL for the SenNet Data Portal Organs page.
+ORGANS_URL = f"{get_app_config().getfield(key='DATA_PORTAL_BASE_URL')}/organs"
+
+ontapi = OntologyAPI()
+
 
 @organ_blueprint.route('/home', methods=['GET'])
 def get_organ_home():
@@ -16,9 +21,7 @@ def get_organ_home():
     Loads the SenNet Data Portal Organs page.
     """
 
-    cfg = AppConfig()
-    url = f"{cfg.getfield(key='DATA_PORTAL_BASE_URL')}/organs"
-    return redirect(url)
+    return redirect(ORGANS_URL)
 
 
 @organ_blueprint.route('/<uberon_id>', methods=['GET'])
@@ -29,24 +32,25 @@ def get_organ(uberon_id):
 
     """
 
-    ontapi = OntologyAPI()
-    endpoint = f'organs?application_context=sennet'
-    organs = ontapi.get_ontology_api_response(endpoint=endpoint, target='organs')
+    organs = ontapi.get_sennet_organs()
+    if not isinstance(organs, dict):
+        # Error (404) from API
+        return organs
+
+    organ = organs['by_uberon'].get(uberon_id)
+    if organ is None:
+        abort(404, f'No SenNet organ with UBERON code {uberon_id}.')
 
     # The organs page uses as search term the term from the UBKG organ endpoint.
     # For organs with laterality (e.g., left lung), the search term corresponds to that of the
     # organ category.
 
-    for organ in organs:
-        if organ.get('organ_uberon') == uberon_id:
-            category = organ.get('category')
-            if category is None:
-                term = organ.get('term')
-            else:
-                term = category.get('term')
-            term = term.lower().replace(' ', '-')
-
-            cfg = AppConfig()
-            organ_url = f"{cfg.getfield(key='DATA_PORTAL_BASE_URL')}/organs"
-            url = f"{organ_url}/{term}"
-            return redirect(url)
+    category = organ.get('category')
+    if category is None:
+        term = organ.get('term')
+    else:
+        term = category.get('term')
+    term = term.lower().replace(' ', '-')
+
+    url = f"{ORGANS_URL}/{term}"
+    return redirect(url)
@@ -5,11 +5,25 @@ information on origins.
 
 from flask import Blueprint, jsonify, redirect
 
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 from models.requestretry import RequestRetry
 
+import logging
+
+# Logging is configured by the application (app.py).
+logger = logging.getLogger(__name__)
+
 origin_blueprint = Blueprint('origin', __name__, url_prefix='/origin')
 
+# SciCrunch Resolver URLs
+cfg = get_app_config()
+SCICRUNCH_BASE_URL = cfg.getfield(key='SCICRUNCH_BASE_URL')
+SCICRUNCH_HIGHER_URL = cfg.getfield(key='SCICRUNCH_HIGHER_URL')
+SCICRUNCH_EXPLORE_URL = cfg.getfield(key='SCICRUNCH_EXPLORE_URL')
+
+# Client for SciCrunch Resolver
+api = RequestRetry()
+
 def translate_searchurl(searchterm:str)->str:
     """
     Uses the searchterm to create the appropriate search URL
@@ -25,18 +39,17 @@ def translate_searchurl(searchterm:str)->str:
     :param searchterm: search term
     """
 
-    cfg = AppConfig()
     if '-' in searchterm:
-        print('high-level')
+        logger.debug('Higher-resolution search term: %s', searchterm)
         # The dash is the delimiter used in higher-resolution IDs.
 
-        base_url = cfg.getfield(key='SCICRUNCH_HIGHER_URL')
+        base_url = SCICRUNCH_HIGHER_URL
         # Move the vendor ID into a parameter of the higher-resolution URL.
         lower_param = searchterm.split('-')[0]
         searchterm = f'{lower_param}?i=rrid%3A{searchterm}'
     else:
         # This is a lower-resolution search term, for RRIDs.
-        base_url = cfg.getfield(key='SCICRUNCH_BASE_URL')
+        base_url = SCICRUNCH_BASE_URL
         searchterm = f'{searchterm}'
 
     return f'{base_url}{searchterm}'
@@ -54,7 +67,6 @@ def getoriginsearchterm(searchterm):
     # at the vendor level) or low-resolution (at the RRID level).
     searchurl = translate_searchurl(searchterm)
     url = f"{searchurl}.json"
-    api = RequestRetry()
     resp = api.getresponse(url=url, format='json')
     return jsonify(resp)
 
@@ -85,8 +97,6 @@ def getorigindetail(id: str = ''):
 
 @origin_blueprint.route('/explore', methods=['GET'])
 def getscicrunchexploresearch():
-    cfg = AppConfig()
-    url = cfg.getfield(key='SCICRUNCH_EXPLORE_URL')
-    return redirect(url)
+    return redirect(SCICRUNCH_EXPLORE_URL)
 
 
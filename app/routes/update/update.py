@@ -2,7 +2,7 @@
 Updates the Senotype repository by writing/overwriting a submission JSON file.
 """
 
-from flask import Blueprint, request, render_template, flash, redirect, session, url_for
+from flask import Blueprint, request, render_template, flash, redirect, session, url_for, jsonify
 
 from werkzeug.datastructures import MultiDict
 import re
@@ -10,20 +10,27 @@ from collections import defaultdict
 
 
 # Helper classes
-from models.appconfig import AppConfig
-from models.senlib import SenLib
+from models.senlib import get_senlib
 from models.editform import EditForm
 
 import logging
 
-# Configure consistent logging. This is done at the beginning of each module instead of with a superclass of
-# logger to avoid the need to overload function calls to logger.
-logging.basicConfig(format='[%(asctime)s] %(levelname)s in %(module)s: %(message)s',
-                    level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S')
+# Logging is configured by the application (app.py).
 logger = logging.getLogger(__name__)
 
 update_blueprint = Blueprint('update', __name__, url_prefix='/update')
 
+# Limit on the size of the url-encoded update form, which posts every input of the edit form
+# as a hidden input. Raised from Flask's default (500 KB) so that large senotypes are not
+# rejected with a 413. It applies only to authenticated update requests.
+_UPDATE_FORM_MEMORY_SIZE = 4 * 1024 * 1024
+
+# Matches the keys of field display inputs--e.g., celltype-0_field_display -> group=celltype, index=0
+_FIELD_DISPLAY_RE = re.compile(r"^(?P<group>.+?)-(?P<idx>\d+)_field_display$")
+
+# Display names used in validation errors for FieldLists whose base names differ from their labels.
+_PREFIX_ERRNAME = {'marker': 'specified marker', 'regmarker': 'regulating marker'}
+
 
 def normalize_multidict(md: MultiDict) -> MultiDict:
     """
@@ -31,17 +38,26 @@ def normalize_multidict(md: MultiDict) -> MultiDict:
     - For fields with multiple values: return a list of non-empty, stripped strings, excluding 'None' (string).
     - For fields with a single value: return the stripped string, not None.
     - Values of string 'None' or blank/whitespace are skipped.
-    Returns a MultiDict (so .getlist() works).
+    Returns a MultiDict (so .getlist() works); this is md itself if nothing needs cleaning.
     """
 
+    # Fast path: return the MultiDict unchanged if no value is blank, the string 'None',
+    # or padded with whitespace.
+    if not any(not value or value == 'None' or value != value.strip()
+               for _, value in md.items(multi=True)):
+        return md
+
+    # Walk every (key, value) pair once, adding the cleaned values directly.
     normalized = MultiDict()
-    for key in md.keys():
-        values = md.getlist(key)
+    add = normalized.add
+    for key, value in md.items(multi=True):
+        if not value:
+            continue
+        # Strip each value once.
+        value = value.strip()
         # Remove empty strings, whitespace, and string 'None'
-        cleaned = [v.strip() for v in values if v and v.strip() and v.strip() != 'None']
-        if cleaned:
-            for entry in cleaned:
-                normalized.add(key, entry)
+        if value and value != 'None':
+            add(key, value)
     return normalized
 
 def get_field_displays(md: MultiDict) -> dict:
@@ -91,11 +107,8 @@ def get_field_displays(md: MultiDict) -> dict:
     # Group by the prefix before "-<ordinal>_field_display"
     grouped = defaultdict(list)
 
-    # matches: celltype-0_field_display -> group=celltype, index=0
-    pat = re.compile(r"^(?P<group>.+?)-(?P<idx>\d+)_field_display$")
-
     for k, v in display_pairs:
-        m = pat.match(k)
+        m = _FIELD_DISPLAY_RE.match(k)
         if not m:
             continue  # skip anything that doesn't match the expected pattern
         group = m.group("group")
@@ -112,7 +125,7 @@ def get_field_displays(md: MultiDict) -> dict:
     return result
 
 
-def validate_form(form, required_field_list_prefixes:list) ->dict:
+def validate_form(form, required_field_list_prefixes: tuple) ->dict:
     """
     Custom validator that includes the hidden inputs passed to the update
     route by the update button on the Edit form.
@@ -126,35 +139,24 @@ def validate_form(form, required_field_list_prefixes:list) ->dict:
     errors = {}
 
     # Standard validation of inputs not populated via modal forms.
+    # validate() has side effects on the fields, so it is called exactly once.
     if not form.validate():
         errors.update(form.errors)
 
-    # form.data is a dict of {fieldname: value}
-    # form._fields contains all Field objects
+    # form._fields is a dict of {fieldname: Field}. Read the data of only the required
+    # FieldLists from it instead of materializing form.data for the whole form.
+    fields = form._fields
 
-    formdata = getattr(form, 'data', {})
-
-    # Check that each prefix has at least one non-empty value in form.data (request.form)
-    # For each prefix, look for keys in form.data that start with prefix and have a non-empty value
+    # Add an error for each required FieldList (e.g., "taxon-" -> "taxon") without a value,
+    # skipping fields that already failed standard validation.
     for prefix in required_field_list_prefixes:
-        # FieldList field base name, e.g. "taxon"
         base_name = prefix.rstrip('-')
-        # Find all keys in formdata that start with prefix and have a value
-        found = False
-        for key in formdata:
-            if key.startswith(base_name):
-                val = formdata[key]
-                if val not in [None, '', [], {}]:
-                    found = True
-                    break
-        # If not found, add error.
-        if not found:
-            if base_name == 'marker':
-                errname = 'specified marker'
-            elif base_name == 'regmarker':
-                errname = 'regulating marker'
-            else:
-                errname = base_name
+        if base_name in errors:
+            continue
+        field = fields.get(base_name)
+        # Form values are strings or lists, so empty values (None, '', []) are falsy.
+        if field is None or not field.data:
+            errname = _PREFIX_ERRNAME.get(base_name, base_name)
             errors[base_name] = [f'At least one {errname} required.']
 
     # Future development:
@@ -166,6 +168,16 @@ def validate_form(form, required_field_list_prefixes:list) ->dict:
     return errors
 
 
+def wants_json() -> bool:
+    """
+    Returns True if the client prefers a JSON response to the rendered edit form.
+    Browser form posts prefer text/html; the full=1 query parameter always selects the rendered form.
+    """
+    if request.args.get('full') == '1':
+        return False
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+
 @update_blueprint.route('', methods=['POST', 'GET'])
 def update():
     """
@@ -178,9 +190,11 @@ def update():
     if 'userid' not in session:
         return redirect(url_for('globus.globus'))
 
+    # Set before the form is first read.
+    request.max_form_memory_size = _UPDATE_FORM_MEMORY_SIZE
+
     # Get IDs for existing Senotype submissions and URLs
-    cfg = AppConfig()
-    senlib = SenLib(cfg=cfg, userid=session['userid'])
+    senlib = get_senlib(userid=session['userid'])
 
     # IDENTIFY THE SENOTYPE VERSION TO CREATE OR UPDATE
     # Information on the version is written to the hidden input named selected_node_id.
@@ -246,8 +260,9 @@ def update():
         senlib.setuserassubmitter(form)
 
     # Clear any prior error messages.
-    if 'flashes' in session:
-        session['flashes'].clear()
+    # Flask keeps pending messages under '_flashes'. Pop them directly: get_flashed_messages()
+    # would cache the drained list for the request and hide messages flashed later.
+    session.pop('_flashes', None)
 
     # VALIDATE INPUTS AND SUBMIT.
     # Apply custom validator of form data.
@@ -277,13 +292,21 @@ def update():
 
         senlib.writesubmission(form_data=form.data, field_displays=field_displays,new_version_id=new_version_id)
 
-        flash(f'Successfully {result_action_root}ed senotype with ID {update_id}.')
+        message = f'Successfully {result_action_root}ed senotype with ID {update_id}.'
+
+        # A client that asks for JSON (e.g., a fetch() call) only needs the acknowledgement and the
+        # refreshed treeview data, so skip reloading and re-rendering the edit form.
+        if wants_json():
+            return jsonify({'ok': True,
+                            'message': message,
+                            'tree_data': senlib.senotypetree,
+                            'selected_node_id': update_id})
+
+        flash(message)
 
         # Trigger a reload of the edit form that refreshes with the updated data.
-        session.pop('form_errors', None)
-        session.pop('form_data', None)
-        form = EditForm(request.form)
-        senlib = SenLib(cfg=cfg, userid=session['userid'])
+        # fetchfromdb repopulates every displayed field from the database, so the validated
+        # form is reused instead of building a new one.
         senlib.fetchfromdb(senotypeid=update_id, form=form)
 
         # Pass to the edit form:
@@ -305,32 +328,41 @@ def update():
 
     else:
         # Inject custom errors into standard WTForms validation errors, avoiding duplicates.
+        fields = form._fields
         for field_name, custom_field_errors in custom_errors.items():
-            if hasattr(form, field_name):
-                form_field = getattr(form, field_name)
-                for err in custom_field_errors:
-                    if err not in form_field.errors:
-                        form_field.errors.append(err)
+            form_field = fields.get(field_name)
+            if form_field is None:
+                continue
+            # FieldList errors can include (unhashable) lists of entry errors.
+            existing = {err for err in form_field.errors if isinstance(err, str)}
+            append_error = form_field.errors.append
+            for err in custom_field_errors:
+                if err not in existing:
+                    append_error(err)
+                    existing.add(err)
 
         flash(f"Error: Validation failed during attempt to {result_action_root}e senotype with ID {update_id}. "
               f"Please check your inputs.", "danger")
 
-        # Pass both the current form data (which, in general, will have been modified
-        # from the existing submission data) and the validation errors from the validated form
-        # to a reload of the form.
-        session['form_errors'] = form.errors
-        session['form_data'] = form.data
+        # Reload the edit form with both the current form data (which, in general, will have been
+        # modified from the existing submission data) and the validation errors from the validated form.
+        # The form is rendered directly instead of redirecting to the edit route so that the form data
+        # does not have to round-trip through the session cookie, which it can overflow.
+        form_data = form.data
+        form_errors = form.errors
+        senlib.getsessiondata(form=form, form_data=form_data)
 
-        # Future development:
-        # Get the state of the FTU path selection.
-        # session['ftu_tree_json'] = request.form.get('ftu_tree_json')
-
-        # Redirect to the edit form, which will set the focus of the treeview back
-        # to the original node.
-        selected_node_id = request.form.get('selected_node_id') or request.args.get('selected_node_id')
+        # Re-inject the validation errors into the reprocessed fields.
+        for field_name, errs in form_errors.items():
+            form_field = fields.get(field_name)
+            if form_field is not None:
+                form_field.errors = errs
 
         # Future development:
-        # Save FTU tree JSON to session for reload
-        # session['ftu_tree_json'] = request.form.get('ftu_tree_json')
+        # Pass the state of the FTU path selection.
 
-        return redirect(url_for('edit.edit', selected_node_id=selected_node_id))
+        # Set the focus of the treeview back to the original node.
+        return render_template('edit.html',
+                               form=form,
+                               response={'tree_data': senlib.senotypetree},
+                               selected_node_id=selected_node_id)
@@ -8,13 +8,12 @@ obtqined by the SenLib class and cached in the current app.
 from typing import Any
 
 from flask import Blueprint, jsonify, current_app, request
-import pandas as pd
 
 # Used to obtain the valueset for location, which is obtained from the hs-ontology-api
 # instead of the senlib database.
 from models.ontology_class import OntologyAPI
 # application configuration
-from models.appconfig import AppConfig
+from models.appconfig import get_app_config
 # Interface to MySql database
 from models.senlib_mysql import SenLibMySql
 
@@ -26,55 +25,46 @@ logging.basicConfig(format='[%(asctime)s] %(levelname)s in %(module)s: %(message
 logger = logging.getLogger(__name__)
 
 valueset_blueprint = Blueprint('valueset', __name__, url_prefix='/valueset')
+ontapi = OntologyAPI()
 
 
 def build_valueset_cache() -> dict[str, Any]:
-    cfg = AppConfig()
+    cfg = get_app_config()
     database = SenLibMySql(cfg=cfg)
     df = database.assertionvaluesets
 
-    # loop through the unique predicates in the db and build cache.
+    # loop through the predicates in the db and build cache, grouping the valuesets
+    # in one pass instead of filtering the DataFrame for each predicate.
+    # The cache is keyed by both the term and the IRI of each predicate, so that
+    # the valueset route resolves either form with a single lookup.
     cache = {}
-    for predicate in df['predicate_term'].unique():
+    for predicate, dfvalueset in df.groupby('predicate_term', sort=False):
         if predicate == 'located_in':
-            # Query the hs-ontology-api to get list of SenNet organs.
-            ontapi = OntologyAPI()
-            endpoint = 'organs?application_context=sennet'
-            response = ontapi.get_ontology_api_response(endpoint=endpoint, target='organs')
+            # Get the list of SenNet organs from the hs-ontology-api. The organs are
+            # cached by OntologyAPI and shared with the organ and ontology routes.
+            response = ontapi.get_sennet_organs()['list']
             listret = [
                 {'id': resp.get('organ_uberon'), 'label': resp.get('term')}
                 for resp in response
             ]
         else:
-            # Convert the valueset dataframe to desired list of dicts
-            listret = [
-                {'id': row['valueset_code'], 'label': row['valueset_term']}
-                for _, row in getapp_assertionvalueset(predicate=predicate, df=df).iterrows()
-            ]
+            # Convert the valueset dataframe to desired list of dicts.
+            # Zip the columns instead of iterating rows, which builds a Series per row.
+            # tolist() returns native Python values, which jsonify can serialize.
+            codes = dfvalueset['valueset_code'].tolist()
+            terms = dfvalueset['valueset_term'].tolist()
+            listret = [{'id': code, 'label': term} for code, term in zip(codes, terms)]
 
         cache[predicate] = listret
+        for iri in dfvalueset['predicate_IRI'].unique():
+            cache.setdefault(iri, listret)
 
     return cache
 
 
-def getapp_assertionvalueset(predicate: str, df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Obtain the valueset associated with an assertion predicate.
-    :param predicate: assertion predicate. Can be either an IRI or a term.
-    """
-
-    # Check whether the predicate corresponds to an IRI.
-    dfassertion = df[df['predicate_IRI'] == predicate]
-    if len(dfassertion) == 0:
-        # Check whether the predicate corresponds to a term.
-        dfassertion = df[df['predicate_term'] == predicate]
-
-    return dfassertion
-
-
 @valueset_blueprint.route('', methods=['GET'])
 def valueset():
-    # Get the assertion predicate.
+    # Get the assertion predicate, as either a term or an IRI.
     predicate = request.args.get('predicate')
 
     # Obtain the valueset for the predicate from the cache.